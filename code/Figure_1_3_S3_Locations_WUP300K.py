@@ -53,10 +53,12 @@
 ##          2. three population size classes (all, above 2 million, and below 2 million)
 
 ##Imported Modules
-import os, sys, numpy, math, copy, warnings, subprocess, pandas
+import os, sys, numpy, math, hashlib, warnings, subprocess, pandas
 import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.ticker as tker
+import matplotlib.transforms as mtrans
+import matplotlib.lines as mlines
 from matplotlib.ticker import FormatStrFormatter
 from builtins import str
 
@@ -75,13 +77,85 @@ msg = "".join([chr(x) for x in p.stdout.readline().split(b" ")[-1].strip()])
 ##Code to enable UTF-8 UNICODE in Windows/DOS
 subprocess.Popen(['chcp','65001'],shell=True,stdout=subprocess.PIPE)
 
+#Random number generator used for every bootstrap draw. Instantiated once at module
+#load; the Generator API (PCG64) is faster than the legacy numpy.random functions and
+#avoids their global-state lock on every call.
+_RNG = numpy.random.default_rng()
+
+#Below this group size the plain resample-and-average path is cheaper, so keep it.
+bs_choice_threshold = 64
+
+#Optional Numba acceleration for the bootstrap kernel. Numba is not part of the
+#required environment; when it is absent, bs_means falls back to its NumPy paths.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    #Compiled kernel: accumulate each bootstrap mean one random draw at a time, so no
+    #index matrix is ever built and memory stays O(bs_iter). The resamples are
+    #independent, so prange spreads them across cores; each thread draws from its own
+    #Numba RNG state rather than the module Generator, which is fine for a bootstrap.
+    @numba.njit(parallel=True,cache=True)
+    def bs_means_jit(npy,bs_iter):
+        n = npy.shape[0]
+        out = numpy.empty(bs_iter)
+        for b in numba.prange(bs_iter):
+            total = 0.0
+            for i in range(n):
+                total += npy[numpy.random.randint(0,n)]
+            out[b] = total/n
+        return out
+
+#Once the total resample work is at least this large, the compiled kernel (when
+#available) amortizes its call overhead and wins over the NumPy paths.
+bs_jit_threshold = 65536
+
+#Number of bootstrap estimates drawn per batch. The scratch matrices in bs_means are
+#at most bs_batch_size x N, so peak memory stays bounded no matter how large bs_iter is.
+bs_batch_size = 256
+
+#Code to compute bootstrapped means for one region and one decade.
+#Inputs:
+##  npy - NumPy array of measurements for one region and decade (size N).
+##  bs_iter - Number of desired estimates in bootstrap.
+#Outputs:
+##  Array of bs_iter bootstrapped means.
+#For large groups, a multinomial draw counts how many times each member would have been
+#resampled, so each bootstrapped mean is just a weighted average. This avoids ever
+#materializing the bs_iter x N resample matrix and gives results that are identical
+#in distribution to resampling with replacement.
+def bs_means(npy,bs_iter,_rng=_RNG):
+    n = npy.shape[0]
+    #Use the compiled kernel for large resample jobs when Numba is installed.
+    if numba is not None and bs_iter*n >= bs_jit_threshold:
+        return bs_means_jit(npy.astype(numpy.float64),bs_iter)
+    #Both paths fill the estimates batch by batch so the per-batch scratch matrix
+    #(indices or multinomial counts) never grows with bs_iter.
+    out = numpy.empty(bs_iter,dtype=npy.dtype)
+    if n < bs_choice_threshold:
+        #For small groups, resample directly. Drawing plain integer indices and
+        #gathering is faster than rng.choice, which carries the machinery for weighted
+        #and without-replacement draws.
+        for b in range(0,bs_iter,bs_batch_size):
+            b_end = min(b+bs_batch_size,bs_iter)
+            out[b:b_end] = npy[_rng.integers(0,n,size=(b_end-b,n))].mean(axis=1)
+    else:
+        #For large groups, draw multinomial resample counts and average by weight.
+        pvals = numpy.full(n,1.0/n)
+        for b in range(0,bs_iter,bs_batch_size):
+            b_end = min(b+bs_batch_size,bs_iter)
+            out[b:b_end] = _rng.multinomial(n,pvals,size=b_end-b) @ npy / n
+    return out
+
 #Code to create estimates that are bootstrapped by means with replacement.
 #Inputs:
 ##  bs_iter - Number of desired estimates in bootstrap. (Currently 1000).
 ##  *data - data sets of urban expansion rate in decade-Intervals (4) or population density in decades (5) where we compute bootstraps from the samples
 #Outputs:
 ##  This function computes bootstrapped estimates for each decade-interval or decade for a region.
-def bstrap(bs_iter,*data):
+def bstrap(bs_iter,*data,_rng=_RNG):
     #If there are four decades, then assume rates of change and allocate four decades.
     if len(list(data)) == 4:
         opt = "rate"
@@ -102,42 +176,38 @@ def bstrap(bs_iter,*data):
 
     #If there are any measurements for a given region in the year 1970...
     if len(data70) > 0:
-        data70 = [float(x)/numr8tr for x in data70]
-        npy70 = numpy.array(data70)
+        npy70 = numpy.asarray(data70,dtype=numpy.float32)/numr8tr
         #Bootstrap Procedure:
         #The following steps are done 1000 times for a group of size N:
         #    The following steps are done N times:
         #        In each group of size N, a random member from that group is drawn.
         #    With a collection of N randomly drawn members, calculate the mean.
         #    Add the mean to the bootstrap result
-        bs70 = numpy.mean(numpy.random.choice(npy70,size=(bs_iter,npy70.shape[0]),replace=True),axis=1)
+        #See bs_means for how the resampling is actually carried out.
+        bs70 = bs_means(npy70,bs_iter,_rng)
     #Otherwise just output an empty array.
     else:
         bs70 = numpy.array([])
     if len(data80) > 0:                
-        data80 = [float(x)/numr8tr for x in data80]
-        npy80 = numpy.array(data80)
-        bs80 = numpy.mean(numpy.random.choice(npy80,size=(bs_iter,npy80.shape[0]),replace=True),axis=1)
+        npy80 = numpy.asarray(data80,dtype=numpy.float32)/numr8tr
+        bs80 = bs_means(npy80,bs_iter,_rng)
     else:
         bs80 = numpy.array([])
     if len(data90) > 0:
-        data90 = [float(x)/numr8tr for x in data90]
-        npy90 = numpy.array(data90)
-        bs90 = numpy.mean(numpy.random.choice(npy90,size=(bs_iter,npy90.shape[0]),replace=True),axis=1)
+        npy90 = numpy.asarray(data90,dtype=numpy.float32)/numr8tr
+        bs90 = bs_means(npy90,bs_iter,_rng)
     else:
         bs90 = numpy.array([])
     if len(data00) > 0:
-        data00 = [float(x)/numr8tr for x in data00]
-        npy00 = numpy.array(data00)
-        bs00 = numpy.mean(numpy.random.choice(npy00,size=(bs_iter,npy00.shape[0]),replace=True),axis=1)
+        npy00 = numpy.asarray(data00,dtype=numpy.float32)/numr8tr
+        bs00 = bs_means(npy00,bs_iter,_rng)
     else:
         bs00 = numpy.array([])
     #If there are five decades, then do a bootstrap of PD for 2010.
     if opt != "rate":
         if len(data10) > 0:
-            data10 = [float(x)/1000 for x in data10]
-            npy10 = numpy.array(data10)
-            bs10 = numpy.mean(numpy.random.choice(npy10,size=(bs_iter,npy10.shape[0]),replace=True),axis=1)
+            npy10 = numpy.asarray(data10,dtype=numpy.float32)/1000
+            bs10 = bs_means(npy10,bs_iter,_rng)
         else:
             bs10 = numpy.array([])
 
@@ -147,6 +217,13 @@ def bstrap(bs_iter,*data):
     else:
         return bs70,bs80,bs90,bs00,bs10
 
+#Code to compute the mean and median of one decade's bootstrapped estimates together.
+#The float64 conversion is done once and shared by both statistics instead of once per
+#statistic; empty arrays yield NaN for both, as before.
+def bs_stats(bs):
+    bs = bs.astype(numpy.float64)
+    return numpy.mean(bs),numpy.median(bs)
+
 #Code to calculate the mean of values of interest between studies that cover the same location
 #and add the mean to a new sample of data. Measurements that have only one study at location are not affected.
 #Inputs:
@@ -158,88 +235,58 @@ def bstrap(bs_iter,*data):
 ##      Since the value is +1, we return to natural counting, which means that the 10th column corresponds to number 10.
 #Outputs:
 ##  a collection of values of averaged estimates for each decade (works with 4 decade intervals or 5 decades)
+#Cache of per-region tables. Each region's rows are converted once from the parsed
+#list-of-rows structure into a single DataFrame whose measurement columns (5 onward)
+#are numeric, so repeated extractions do not re-transpose and re-parse the same
+#strings. The id of the regions structure keeps the three size classes apart.
+region_table_cache = {}
+def region_table(regions,m):
+    cache_key = (id(regions),m)
+    if cache_key not in region_table_cache:
+        df = pandas.DataFrame(regions[m])
+        #Coerce the measurement columns to numbers. Blank entries ('' or ' ') become NaN.
+        df = pandas.concat([df.iloc[:,:4],df.iloc[:,4:].apply(pandas.to_numeric,errors='coerce')],axis=1)
+        region_table_cache[cache_key] = df
+    return region_table_cache[cache_key]
+
+#Cache of loc_average results. plot_linear and plot_log ask for the same region and
+#column-range extraction several times per file, so each one is computed only once.
+#The id of the regions structure keeps the three size classes apart.
+loc_average_cache = {}
 def loc_average(regions,m,data_index_start,data_index_end):
-    #Get the names of all urban agglomerations.
-    loc_name = list(zip(*regions[m]))[0]
+    #If this extraction was already computed, hand back the cached lists.
+    cache_key = (id(regions),m,data_index_start,data_index_end)
+    if cache_key in loc_average_cache:
+        return loc_average_cache[cache_key]
+    #Get the region's rows as one typed table (built once per region, see region_table).
+    df = region_table(regions,m)
+    #Encode the urban agglomeration names as integer group codes in one vectorized
+    #pass; grouping on small ints is cheaper than comparing strings row by row.
+    loc_code = numpy.unique(df.iloc[:,0],return_inverse=True)[1]
     #Are we dealing with 4 decade-intervals or 5 decades? Look at interval between data_index_start and data_index_end
-    #This sets up an appropriate data extraction and sets the opt token for other operations.
     #If the number of decades is not 4 or 5, then thrown an error.
-    if data_index_end - data_index_start == 4:
-        opt = "rate"
-        data70,data80,data90,data00 = list(zip(*regions[m]))[data_index_start:data_index_end]
-    elif data_index_end - data_index_start == 5:
-        opt = "PD"
-        data70,data80,data90,data00,data10 = list(zip(*regions[m]))[data_index_start:data_index_end]
-    else:
+    if data_index_end - data_index_start not in (4,5):
         raise Exception("Number of decades should be 4 or 5.")
 
-    #Create list of unique urban agglomeration names.
-    loc_name_unique = []
-    for i in range(len(loc_name)):
-        if loc_name_unique.count(loc_name[i]) == 0:
-            loc_name_unique.append(loc_name[i])
-    #Set up lists for change that is averaged at each location
-    if opt == "rate":
-        loc70,loc80,loc90,loc00 = [],[],[],[]
-    else:
-        loc70,loc80,loc90,loc00,loc10 = [],[],[],[],[]
-    #For Each Urban Agglomeration...
-    for j in range(len(loc_name_unique)):
-        #Create a list of indices that correspond to each urban agglomeration with a particular name.
-        loc_index = []
-        #Go through all urban agglomeration names to see which match the current urban agglomeration.
-        for i in range(len(loc_name)):
-            if loc_name[i] == loc_name_unique[j]:
-                loc_index.append(i)
-        #Sums all percent change that are attributed to a particular urban agglomeration
-        if opt == "rate":
-            sum_loc70,sum_loc80,sum_loc90,sum_loc00,sub_loc70,sub_loc80,sub_loc90,sub_loc00 = 0,0,0,0,0,0,0,0
-        else:
-            sum_loc70,sum_loc80,sum_loc90,sum_loc00,sum_loc10,sub_loc70,sub_loc80,sub_loc90,sub_loc00,sub_loc10 = 0,0,0,0,0,0,0,0,0,0
-        for k in range(len(loc_index)):
-            if data70[loc_index[k]] != '' and data70[loc_index[k]] != ' ':
-                #If there is data, add study to sum for 70-80
-                sum_loc70 += float(data70[loc_index[k]])
-            else:
-                #If no data, increase the amount to subtract from all studies that are of the specific Urban Agglomeration for 70-80
-                sub_loc70 += 1 
-            if data80[loc_index[k]] != '' and data80[loc_index[k]] != ' ':
-                sum_loc80 += float(data80[loc_index[k]])
-            else:
-                sub_loc80 += 1 
-            if data90[loc_index[k]] != '' and data90[loc_index[k]] != ' ':
-                sum_loc90 += float(data90[loc_index[k]])
-            else:
-                sub_loc90 += 1 
-            if data00[loc_index[k]] != '' and data00[loc_index[k]] != ' ':
-                sum_loc00 += float(data00[loc_index[k]])
-            else:
-                sub_loc00 += 1
-            if opt != "rate":
-                if data10[loc_index[k]] != '' and data10[loc_index[k]] != ' ':
-                    sum_loc10 += float(data10[loc_index[k]])
-                else:
-                    sub_loc10 += 1
-                
-        if (len(loc_index)-sub_loc70) > 0:
-            #If there are values for 70-80, append location mean for loc70
-            loc70.append(sum_loc70/(len(loc_index)-sub_loc70))
-        if (len(loc_index)-sub_loc80) > 0:
-            loc80.append(sum_loc80/(len(loc_index)-sub_loc80))
-        if (len(loc_index)-sub_loc90) > 0:
-            loc90.append(sum_loc90/(len(loc_index)-sub_loc90))
-        if (len(loc_index)-sub_loc00) > 0:
-            loc00.append(sum_loc00/(len(loc_index)-sub_loc00))
-        if opt != "rate":
-            #If there are five decades, take the mean of the last decade.
-            if (len(loc_index)-sub_loc10) > 0:
-                loc10.append(sum_loc10/(len(loc_index)-sub_loc10))
-
-    #Return the appropriate number of decades.
-    if opt == "rate":
-        return loc70[:],loc80[:],loc90[:],loc00[:]
-    else:
-        return loc70[:],loc80[:],loc90[:],loc00[:],loc10[:]
+    #Average the studies that cover the same location. For each decade column, sum the
+    #non-blank values per location code and count the non-blank studies per location
+    #code -- two weighted histograms via numpy.bincount -- then divide. This matches
+    #the old per-study sum/subtract bookkeeping, and locations where every study was
+    #blank for a given decade are dropped, as before.
+    vals = df.iloc[:,data_index_start:data_index_end].to_numpy(dtype=numpy.float64)
+    valid = ~numpy.isnan(vals)
+    n_loc = int(loc_code.max())+1 if len(loc_code) > 0 else 0
+    loc_means = []
+    for k in range(vals.shape[1]):
+        sums = numpy.bincount(loc_code,weights=numpy.where(valid[:,k],vals[:,k],0.0),minlength=n_loc)
+        counts = numpy.bincount(loc_code,weights=valid[:,k],minlength=n_loc)
+        has_data = counts > 0
+        loc_means.append((sums[has_data]/counts[has_data]).tolist())
+
+    #Cache and return the per-decade lists directly; no caller mutates them, so the
+    #defensive copy-on-return slices are not needed.
+    loc_average_cache[cache_key] = tuple(loc_means)
+    return loc_average_cache[cache_key]
 
 #This function makes six linear-scaled plots that correspond to rates of urban expansion vs population change and
 #population density for all three size classes (all, above 2 million, below 2 million). This function generates bootstrapped
@@ -262,6 +309,24 @@ def loc_average(regions,m,data_index_start,data_index_end):
 ##  region_means - This file has all the means and medians computed from bootstrapped estimates.
 def plot_linear(regions,region_unique,label_dict,ifile_path,summary_output_file_handle,bstrap_output_file_handle,opic_string,number_of_decade_intervals,ylimList):
     region_means = []
+    #Chart labels for the regions, looked up once rather than per axis.
+    region_labels = [label_dict[x] for x in region_unique]
+    #Number of bootstrapped estimates per region and decade.
+    bs_iter = 1000
+    #On-disk cache of this size class's bootstrapped estimates, kept next to the
+    #outputs. Re-running the script (e.g. to adjust plot cosmetics) reloads the
+    #stored draws instead of recomputing them. A hash of the input file rides along
+    #in the cache, so draws computed from an older version of the input are thrown
+    #away instead of being served silently; setting the FORCE_UPDATE_BOOTSTRAP
+    #environment variable forces fresh draws regardless.
+    bs_cache_path = os.path.join(os.path.split(ifile_path)[0],'{:s}_bstrap_cache.npz'.format(opic_string))
+    with open(ifile_path,'rb') as ifile_handle:
+        ifile_hash = hashlib.sha256(ifile_handle.read()).hexdigest()
+    bs_cache = {}
+    if os.path.exists(bs_cache_path) and not os.environ.get('FORCE_UPDATE_BOOTSTRAP'):
+        bs_cache = dict(numpy.load(bs_cache_path))
+        if str(bs_cache.pop('input_hash','')) != ifile_hash:
+            bs_cache = {}
     #For Each Region...
     for m in range(len(region_unique)):
         #Create estimates that are averaged from studies that cover the same location.
@@ -288,7 +353,10 @@ def plot_linear(regions,region_unique,label_dict,ifile_path,summary_output_file_
 
     #Set up plot
     ##  Set up figure dimensions for Urban Area Expansion Rate and Population Change Rate
-    fig = plt.figure(1,figsize=(8,3))
+    ##Figure 1 is created on the first call and reused afterwards; clear the
+    ##previous call's artists.
+    fig = plt.figure(1) if plt.fignum_exists(1) else plt.figure(1,figsize=(8,3))
+    fig.clf()
     ##Set plot inside figure. This one is for population precentage.
     tp_axis = plt.axes([0.085,0.2,0.83,0.65])
     ##Clear X axis of default ticks.
@@ -305,7 +373,7 @@ def plot_linear(regions,region_unique,label_dict,ifile_path,summary_output_file_
         ##Set up colors for decades 70-80,80-90,90-00,00-10
         colors = [(0.0,0.0,0.6,1.0),(0.6,0.0,0.0,1.0),(0.0,0.6,0.0,1.0),(0.6,0.6,0.0,1.0)]
         ##Plot the custom symbol for each decade.
-        tp_axis.scatter(range(start,len(item)+start),item,s=50,marker=verts,color=colors,picker=True)
+        tp_axis.scatter(range(start,len(item)+start),item,s=50,marker=verts,color=colors)
         ##Set up positions to annotate for reach region.
         xtick_list.append(start+((len(item))/2.0)-0.5)        
         start += number_of_decade_intervals + 1
@@ -317,18 +385,14 @@ def plot_linear(regions,region_unique,label_dict,ifile_path,summary_output_file_
     tp_axis.set_ylim(ylimList[0][0],ylimList[0][1])
 
     #Sets the y axis with increments of 2 between low value and high value on left y axis.
-    tp_yticks = []
-    l = ylimList[0][0]
-    while l <= ylimList[0][1]:
-        tp_yticks.append(l)
-        l+=2
+    tp_yticks = numpy.arange(ylimList[0][0],ylimList[0][1],2).tolist()
     if tp_yticks[-1] != ylimList[0][1]:
         tp_yticks.append(ylimList[0][1])
     tp_axis.set_yticks(tp_yticks)
 
-    #Set up some gridlines to correspond to each y tick, except the top and bottom of the plot.
-    for xtick in tp_yticks[1:-1]:
-        plt.plot([0,100],[xtick,xtick],linestyle=':',color=(0.8,0.8,0.8),linewidth=0.5,alpha=0.35)
+    #Set up gridlines at the y ticks, drawn by the axis in one pass. The first and last
+    #tick sit on the plot frame, so their lines are hidden by the spines.
+    tp_axis.yaxis.grid(True,linestyle=':',color=(0.8,0.8,0.8),linewidth=0.5,alpha=0.35)
 
     #Create an axis on the right side of the plot. This axis will cover urban expansion percentage.
     mi_axis = tp_axis.twinx()
@@ -340,87 +404,108 @@ def plot_linear(regions,region_unique,label_dict,ifile_path,summary_output_file_
 
     #Set up space for output to put bootstrapped urban expansion rates logarithmic plot.
     bs_pack1 = []
-    bs_dict1 = {}
+    #Preallocate one Excel column per region and decade-interval; only the columns
+    #that actually receive estimates are written out.
+    bs_mat1 = numpy.empty((bs_iter,len(region_unique)*4),dtype=numpy.float32)
+    bs_keys1 = []
+    #Sets up colors for decades 70-80,80-90,90-00,00-10, plus unattached proxy
+    #artists that serve as the legend handles for them.
+    color_array = [(0.0,0.0,0.6,0.3),(0.6,0.0,0.0,0.3),(0.0,0.6,0.0,0.3),(0.6,0.6,0.0,0.3)]
+    scatter_list = [mlines.Line2D([],[],color=c,marker='o',linestyle='none',markeredgecolor='none',markersize=0.2**0.5) for c in color_array]
+    #Boxplot x offsets within a region's slot, computed once and shifted by
+    #start for each region.
+    box_offsets = numpy.arange(4)
+    #Boxplot count labels are collected during the loop and drawn in one pass
+    #after it. The 2-point upward offset is baked into a transform built once.
+    anno_list = []
+    anno_trans = mtrans.offset_copy(mi_axis.transData,fig=fig,x=0,y=2,units='points')
     #For each region...
     for m, cur_region in enumerate(region_unique):
         #Retrieve urban expansion estimates
         data70,data80,data90,data00 = loc_average(regions,m,18,22)
 
-        #Create bootstrapped estimates of urban expansion estimates
-        bs70,bs80,bs90,bs00 = bstrap(1000,data70,data80,data90,data00)
+        #Create bootstrapped estimates of urban expansion estimates, unless the disk
+        #cache already holds this region's draws.
+        cache_keys = ['UER_{:d}_{:d}'.format(m,j) for j in range(4)]
+        if all(ck in bs_cache for ck in cache_keys):
+            bs70,bs80,bs90,bs00 = [bs_cache[ck] for ck in cache_keys]
+        else:
+            bs70,bs80,bs90,bs00 = bstrap(bs_iter,data70,data80,data90,data00)
+            for ck,bs in zip(cache_keys,(bs70,bs80,bs90,bs00)):
+                bs_cache[ck] = bs
 
-        #Prepare the output for use in logarithmic plots.
-        bs_pack1.append((bs70,bs80,bs90,bs00))
+        #Prepare the output for use in logarithmic plots, along with the estimate
+        #counts so the log plot does not re-extract the data just to count it.
+        bs_pack1.append((bs70,bs80,bs90,bs00,(len(data70),len(data80),len(data90),len(data00))))
 
         #Ignores a runtimewarning when mean is calculated for empty list.
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             #Output means and medians of bootstrapped estimates to summary statistics file.
-            bs70_mean,bs80_mean,bs90_mean,bs00_mean = numpy.mean(bs70.astype(numpy.float64)),numpy.mean(bs80.astype(numpy.float64)),numpy.mean(bs90.astype(numpy.float64)),numpy.mean(bs00.astype(numpy.float64))
-            bs70_median,bs80_median,bs90_median,bs00_median = numpy.median(bs70.astype(numpy.float64)),numpy.median(bs80.astype(numpy.float64)),numpy.median(bs90.astype(numpy.float64)),numpy.median(bs00.astype(numpy.float64))
+            (bs70_mean,bs70_median),(bs80_mean,bs80_median),(bs90_mean,bs90_median),(bs00_mean,bs00_median) = bs_stats(bs70),bs_stats(bs80),bs_stats(bs90),bs_stats(bs00)
         summary_output_file_handle.write("{:s}\nUrban Expansion Rates\n{:s}\n1970 Mean,{:.15f}\n1970 Median,{:.15f}\n1980 Mean,{:.15f}\n1980 Median,{:.15f}\n1990 Mean,{:.15f}\n1990 Median,{:.15f}\n2000 Mean,{:.15f}\n2000 Median,{:.15f}\n".format(cur_region,opic_string,bs70_mean,bs70_median,bs80_mean,bs80_median,bs90_mean,bs90_median,bs00_mean,bs00_median))
 
-        for bs_item in [('70-80',bs70),('80-90',bs80),('90-00',bs90),('00-10',bs00)]:
-            bs_key = '_'.join([cur_region.replace(' ','_'),opic_string,bs_item[0]])
-            bs_data = bs_dict1.get(bs_key,0)
-            if len(bs_item[1]) == 0:
+        #Record this region's bootstrapped estimates for the Excel sheet, filling the
+        #next free column of the preallocated matrix.
+        for bs_label,bs_array in [('70-80',bs70),('80-90',bs80),('90-00',bs90),('00-10',bs00)]:
+            if len(bs_array) == 0:
                 continue
-            if bs_data == 0:
-                bs_dict1[bs_key] = bs_item[1].tolist()
+            bs_mat1[:,len(bs_keys1)] = bs_array
+            bs_keys1.append('_'.join([cur_region.replace(' ','_'),opic_string,bs_label]))
 
         #Create data_array to inputation into the plot. orig_array is used to calculate number of estimates.
         data_array = [bs70,bs80,bs90,bs00]
         orig_array = [data70,data80,data90,data00]
         #Sets up attributes for setting properties of boxplot.
-        color_array = [(0.0,0.0,0.6,0.3),(0.6,0.0,0.0,0.3),(0.0,0.6,0.0,0.3),(0.6,0.6,0.0,0.3)]
         index_array = [(0,1,1,1,0,1,0,1,0),(1,3,3,3,2,3,2,3,1),(2,5,5,5,4,5,4,5,2),(3,7,7,7,6,7,6,7,3)]
 
         #Sets up crude boxplot.
-        bp = mi_axis.boxplot(data_array,positions=list(numpy.linspace(start,4+start,4,False)),patch_artist=True,showfliers=False,zorder=10)
+        bp = mi_axis.boxplot(data_array,positions=box_offsets+start,patch_artist=True,showfliers=False,zorder=10)
 
         #Sets up jitter part of box-jitter plots and other cosmetic features.
-        scatter_list = []
+        jitter_x,jitter_y,jitter_c = [],[],[]
         for j in range(4):
-            plt.setp(bp['boxes'][index_array[j][0]],    color=(0.6,0.6,0.6), lw=0.25, fill=False)
-            yanno = plt.getp(bp['caps'][index_array[j][1]],'ydata')[0]
-            xanno = (plt.getp(bp['caps'][index_array[j][2]],'xdata')[0]+plt.getp(bp['caps'][index_array[j][3]],'xdata')[1])/2.0
+            bp['boxes'][index_array[j][0]].set(color=(0.6,0.6,0.6), lw=0.25, fill=False)
+            yanno = bp['caps'][index_array[j][1]].get_ydata()[0]
+            xanno = (bp['caps'][index_array[j][2]].get_xdata()[0]+bp['caps'][index_array[j][3]].get_xdata()[1])/2.0
             #Ensures that width of jitter on bow jitter plot does not exceed width of boxplot element.
-            jitter_bias = abs(plt.getp(bp['caps'][index_array[j][2]],'xdata')[0]-xanno)
-            jitter = numpy.add(numpy.multiply(numpy.random.random_sample(len(data_array[j])),(2.0*jitter_bias)),(xanno-jitter_bias))
-            #This makes jitter plot and records handle for legend.
-            scatter_list.append(plt.scatter(jitter, data_array[j], c=[color_array[j]], marker='o', edgecolors='none', alpha=0.1, s=0.2, zorder=5))
-            #This sets up numbers on top of boxplots
-            plt.annotate('{:d}'.format(len(orig_array[j])),xy=(xanno,yanno),xytext=(0,2),size=5.25,horizontalalignment='center',textcoords='offset points')
+            jitter_bias = abs(bp['caps'][index_array[j][2]].get_xdata()[0]-xanno)
+            jitter = _RNG.uniform(xanno-jitter_bias,xanno+jitter_bias,size=len(data_array[j]))
+            #Collect this decade's jitter points; they are drawn in one batch per region below.
+            jitter_x.append(jitter)
+            jitter_y.append(data_array[j])
+            jitter_c.append(numpy.tile(color_array[j],(len(data_array[j]),1)))
+            #Record this boxplot's estimate count; the labels are drawn in one pass below.
+            anno_list.append((xanno,yanno,len(orig_array[j])))
             #Makes edges of boxplots for less thickness and grey color.
-            plt.setp(bp['caps'][index_array[j][4]], color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['caps'][index_array[j][5]], color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['whiskers'][index_array[j][6]], color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['whiskers'][index_array[j][7]], color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['medians'][index_array[j][8]], color=(0.6,0.6,0.6), lw=0.25)
+            bp['caps'][index_array[j][4]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['caps'][index_array[j][5]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['whiskers'][index_array[j][6]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['whiskers'][index_array[j][7]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['medians'][index_array[j][8]].set(color=(0.6,0.6,0.6), lw=0.25)
+        #This makes the jitter plot with one scatter call per region instead of one per decade.
+        plt.scatter(numpy.concatenate(jitter_x),numpy.concatenate(jitter_y),c=numpy.concatenate(jitter_c),marker='o',edgecolors='none',alpha=0.1,s=0.2,zorder=5,rasterized=True)
         #Sets up ticks to annotate different regions.
         xtick_list.append(start+((4)/2.0)-0.5)
         start += number_of_decade_intervals + 1
 
-    df = pandas.DataFrame(bs_dict1)
+    #Draw the collected boxplot count labels in one pass over the flat list.
+    for xanno,yanno,n_est in anno_list:
+        mi_axis.text(xanno,yanno,'{:d}'.format(n_est),size=5.25,horizontalalignment='center',transform=anno_trans)
+
+    df = pandas.DataFrame(bs_mat1[:,:len(bs_keys1)],columns=bs_keys1)
     df.to_excel(bstrap_output_file_handle, sheet_name="UER_{:s}".format(opic_string))
 
     #This sets the x and y limits.
     mi_axis.set_xlim(0,51)
     mi_axis.set_ylim(ylimList[0][0],ylimList[0][1])
     
-    #Sets the y axis with increments of 2 between low value and high value on right y axis.
-    tp_yticks = []
-    l = ylimList[0][0]
-    while l <= ylimList[0][1]:
-        tp_yticks.append(l)
-        l+=2
-    if tp_yticks[-1] != ylimList[0][1]:
-        tp_yticks.append(ylimList[0][1])
+    #The right y axis carries the same ticks as the left one.
     mi_axis.set_yticks(tp_yticks)
 
     #Sets annotation for x axis.
     tp_axis.set_xticks(xtick_list)
-    tp_axis.set_xticklabels([label_dict[x] for x in region_unique],horizontalalignment='right',rotation=30,family='sans-serif')
+    tp_axis.set_xticklabels(region_labels,horizontalalignment='right',rotation=30,family='sans-serif')
     tp_axis.yaxis.set_major_formatter(FormatStrFormatter('%d'))
 
     #Sets label for right y axes.
@@ -441,7 +526,10 @@ def plot_linear(regions,region_unique,label_dict,ifile_path,summary_output_file_
     plt.show()
     
     #Set up figure dimensions for Population Density
-    fig = plt.figure(2,figsize=(8,3))
+    ##Figure 2 is created on the first call and reused afterwards; clear the
+    ##previous call's artists.
+    fig = plt.figure(2) if plt.fignum_exists(2) else plt.figure(2,figsize=(8,3))
+    fig.clf()
     bt_axis = plt.axes([0.085,0.2,0.82,0.65])
 
     xtick_list = []
@@ -451,106 +539,124 @@ def plot_linear(regions,region_unique,label_dict,ifile_path,summary_output_file_
 
     #Set up space for output to put bootstrapped population density logarithmic plot.
     bs_pack2 = []
-    bs_dict2 = {}
+    #Preallocate one Excel column per region and decade; only the columns that
+    #actually receive estimates are written out.
+    bs_mat2 = numpy.empty((bs_iter,len(region_unique)*5),dtype=numpy.float32)
+    bs_keys2 = []
+    #Sets up colors for decades 1970-2010, plus unattached proxy artists that serve
+    #as the legend handles for them.
+    color_array = [(0.0,0.0,0.6,0.3),(0.6,0.0,0.0,0.3),(0.0,0.6,0.0,0.3),(0.6,0.6,0.0,0.3),(0.6,0.6,0.6,0.3)]
+    scatter_list = [mlines.Line2D([],[],color=c,marker='o',linestyle='none',markeredgecolor='none',markersize=0.2**0.5) for c in color_array]
+    #Boxplot x offsets within a region's slot, computed once and shifted by
+    #start for each region.
+    box_offsets = numpy.arange(5)
+    #Boxplot count labels are collected during the loop and drawn in one pass
+    #after it. The 2-point upward offset is baked into a transform built once.
+    anno_list = []
+    anno_trans = mtrans.offset_copy(bt_axis.transData,fig=fig,x=0,y=2,units='points')
     #For each region...
     for m, cur_region in enumerate(region_unique):
         #Create estimates that are averaged from studies that cover the same location.
         data70,data80,data90,data00,data10 = loc_average(regions,m,22,27)
 
-        #Create bootstrapped estimates of urban expansion estimates
-        bs70,bs80,bs90,bs00,bs10 = bstrap(1000,data70,data80,data90,data00,data10)
+        #Create bootstrapped estimates of population density, unless the disk cache
+        #already holds this region's draws.
+        cache_keys = ['PD_{:d}_{:d}'.format(m,j) for j in range(5)]
+        if all(ck in bs_cache for ck in cache_keys):
+            bs70,bs80,bs90,bs00,bs10 = [bs_cache[ck] for ck in cache_keys]
+        else:
+            bs70,bs80,bs90,bs00,bs10 = bstrap(bs_iter,data70,data80,data90,data00,data10)
+            for ck,bs in zip(cache_keys,(bs70,bs80,bs90,bs00,bs10)):
+                bs_cache[ck] = bs
 
-        #Prepare the output for use in logarithmic plots.
-        bs_pack2.append((bs70,bs80,bs90,bs00,bs10))
+        #Prepare the output for use in logarithmic plots, along with the estimate
+        #counts so the log plot does not re-extract the data just to count it.
+        bs_pack2.append((bs70,bs80,bs90,bs00,bs10,(len(data70),len(data80),len(data90),len(data00),len(data10))))
 
         #Ignores a runtimewarning when mean is calculated for empty list.
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             #Output means and medians of bootstrapped estimates to summary statistics file.
-            bs70_mean,bs80_mean,bs90_mean,bs00_mean,bs10_mean = numpy.mean(bs70.astype(numpy.float64)),numpy.mean(bs80.astype(numpy.float64)),numpy.mean(bs90.astype(numpy.float64)),numpy.mean(bs00.astype(numpy.float64)),numpy.mean(bs10.astype(numpy.float64))
-            bs70_median,bs80_median,bs90_median,bs00_median,bs10_median = numpy.median(bs70.astype(numpy.float64)),numpy.median(bs80.astype(numpy.float64)),numpy.median(bs90.astype(numpy.float64)),numpy.median(bs00.astype(numpy.float64)),numpy.median(bs10.astype(numpy.float64))
+            (bs70_mean,bs70_median),(bs80_mean,bs80_median),(bs90_mean,bs90_median),(bs00_mean,bs00_median),(bs10_mean,bs10_median) = bs_stats(bs70),bs_stats(bs80),bs_stats(bs90),bs_stats(bs00),bs_stats(bs10)
         summary_output_file_handle.write("{:s}\nPopulation Density\n{:s}\n1970 Mean,{:.15f}\n1970 Median,{:.15f}\n1980 Mean,{:.15f}\n1980 Median,{:.15f}\n1990 Mean,{:.15f}\n1990 Median,{:.15f}\n2000 Mean,{:.15f}\n2000 Median,{:.15f}\n2010 Mean,{:.15f}\n2010 Median,{:.15f}\n".format(cur_region,opic_string,bs70_mean,bs70_median,bs80_mean,bs80_median,bs90_mean,bs90_median,bs00_mean,bs00_median,bs10_mean,bs10_median))
 
-        for bs_item in [('1970',bs70),('1980',bs80),('1990',bs90),('2000',bs00),('2010',bs10)]:
-            bs_key = '_'.join([cur_region.replace(' ','_'),opic_string,bs_item[0]])
-            bs_data = bs_dict2.get(bs_key,0)
-            if len(bs_item[1]) == 0:
+        #Record this region's bootstrapped estimates for the Excel sheet, filling the
+        #next free column of the preallocated matrix.
+        for bs_label,bs_array in [('1970',bs70),('1980',bs80),('1990',bs90),('2000',bs00),('2010',bs10)]:
+            if len(bs_array) == 0:
                 continue
-            if bs_data == 0:
-                bs_dict2[bs_key] = bs_item[1].tolist()
+            bs_mat2[:,len(bs_keys2)] = bs_array
+            bs_keys2.append('_'.join([cur_region.replace(' ','_'),opic_string,bs_label]))
 
         #Create data_array to inputation into the plot. orig_array is used to calculate number of estimates.
         data_array = [bs70,bs80,bs90,bs00,bs10]
         orig_array = [data70,data80,data90,data00,data10]
         #Sets up attributes for setting properties of boxplot.
-        color_array = [(0.0,0.0,0.6,0.3),(0.6,0.0,0.0,0.3),(0.0,0.6,0.0,0.3),(0.6,0.6,0.0,0.3),(0.6,0.6,0.6,0.3)]
         index_array = [(0,1,1,1,0,1,0,1,0),(1,3,3,3,2,3,2,3,1),(2,5,5,5,4,5,4,5,2),(3,7,7,7,6,7,6,7,3),(4,9,9,9,8,9,8,9,4)]
 
         #Sets up crude boxplot.
-        bp = plt.boxplot(data_array,positions=list(numpy.linspace(start,5+start,5,False)),patch_artist=True,showfliers=False,zorder=10)
+        bp = plt.boxplot(data_array,positions=box_offsets+start,patch_artist=True,showfliers=False,zorder=10)
 
         #Sets up jitter part of box-jitter plots and other cosmetic features.
-        scatter_list = []
+        jitter_x,jitter_y,jitter_c = [],[],[]
         for j in range(5):
-            plt.setp(bp['boxes'][index_array[j][0]], color=(0.6,0.6,0.6), lw=0.25, fill=False)
-            yanno = plt.getp(bp['caps'][index_array[j][1]],'ydata')[0]
-            xanno = (plt.getp(bp['caps'][index_array[j][2]],'xdata')[0]+plt.getp(bp['caps'][index_array[j][3]],'xdata')[1])/2.0
+            bp['boxes'][index_array[j][0]].set(color=(0.6,0.6,0.6), lw=0.25, fill=False)
+            yanno = bp['caps'][index_array[j][1]].get_ydata()[0]
+            xanno = (bp['caps'][index_array[j][2]].get_xdata()[0]+bp['caps'][index_array[j][3]].get_xdata()[1])/2.0
             #Ensures that width of jitter on bow jitter plot does not exceed width of boxplot element.
-            jitter_bias = abs(plt.getp(bp['caps'][index_array[j][2]],'xdata')[0]-xanno)
-            jitter = numpy.add(numpy.multiply(numpy.random.random_sample(len(data_array[j])),(2.0*jitter_bias)),(xanno-jitter_bias))
-            #This makes jitter plot and records handle for legend.
-            scatter_list.append(plt.scatter(jitter, data_array[j], c=[color_array[j]], marker='o', edgecolors='none', alpha=0.1, s=0.2, zorder=5))
-            #This sets up numbers on top of boxplots
-            plt.annotate('{:d}'.format(len(orig_array[j])),xy=(xanno,yanno),xytext=(0,2),size=5.25,horizontalalignment='center',textcoords='offset points')
+            jitter_bias = abs(bp['caps'][index_array[j][2]].get_xdata()[0]-xanno)
+            jitter = _RNG.uniform(xanno-jitter_bias,xanno+jitter_bias,size=len(data_array[j]))
+            #Collect this decade's jitter points; they are drawn in one batch per region below.
+            jitter_x.append(jitter)
+            jitter_y.append(data_array[j])
+            jitter_c.append(numpy.tile(color_array[j],(len(data_array[j]),1)))
+            #Record this boxplot's estimate count; the labels are drawn in one pass below.
+            anno_list.append((xanno,yanno,len(orig_array[j])))
             #Makes edges of boxplots for less thickness and grey color.
-            plt.setp(bp['caps'][index_array[j][4]],     color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['caps'][index_array[j][5]],     color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['whiskers'][index_array[j][6]], color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['whiskers'][index_array[j][7]], color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['medians'][index_array[j][8]],  color=(0.6,0.6,0.6), lw=0.25)
-
-        #Sets up legend for plot
-        leg = bt_axis.legend(tuple(scatter_list),("1970","1980","1990","2000","2010"),scatterpoints=1,markerscale=10.0,edgecolor=(0,0,0),fontsize=6.0,loc="upper left",bbox_to_anchor=(0.02,0.98))
-        for lh in leg.legendHandles:
-            lh.set_alpha(1)
-        leg.set_zorder(20)
-        leg.set_alpha(1)
+            bp['caps'][index_array[j][4]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['caps'][index_array[j][5]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['whiskers'][index_array[j][6]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['whiskers'][index_array[j][7]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['medians'][index_array[j][8]].set(color=(0.6,0.6,0.6), lw=0.25)
+
+        #This makes the jitter plot with one scatter call per region instead of one per decade.
+        plt.scatter(numpy.concatenate(jitter_x),numpy.concatenate(jitter_y),c=numpy.concatenate(jitter_c),marker='o',edgecolors='none',alpha=0.1,s=0.2,zorder=5,rasterized=True)
         xtick_list.append(start+((5)/2.0)-0.5)
         start += number_of_decade_intervals + 2
 
-    df = pandas.DataFrame(bs_dict2)
+    #Sets up legend for plot once per figure, rather than once per region.
+    leg = bt_axis.legend(tuple(scatter_list),("1970","1980","1990","2000","2010"),scatterpoints=1,markerscale=10.0,edgecolor=(0,0,0),fontsize=6.0,loc="upper left",bbox_to_anchor=(0.02,0.98))
+    for lh in leg.legendHandles:
+        lh.set_alpha(1)
+    leg.set_zorder(20)
+    leg.set_alpha(1)
+
+    #Draw the collected boxplot count labels in one pass over the flat list.
+    for xanno,yanno,n_est in anno_list:
+        bt_axis.text(xanno,yanno,'{:d}'.format(n_est),size=5.25,horizontalalignment='center',transform=anno_trans)
+
+    df = pandas.DataFrame(bs_mat2[:,:len(bs_keys2)],columns=bs_keys2)
     df.to_excel(bstrap_output_file_handle, sheet_name="PD_{:s}".format(opic_string))
 
-    #Sets annotation for y axis.
+    #Sets annotation for y axis. Ticks run from the low limit through multiples of 10.
     bt_axis.set_ylim(ylimList[1][0],ylimList[1][1])
-    bt_yticks = []
-    bt_yticks.append(ylimList[1][0])
-    for l in range(10,ylimList[1][1],10):
-        if l != ylimList[1][0]:
-            bt_yticks.append(l)
+    bt_yticks = [ylimList[1][0]]+[l for l in numpy.arange(10,ylimList[1][1],10).tolist() if l != ylimList[1][0]]
     if bt_yticks[-1] != ylimList[1][1]:
         bt_yticks.append(ylimList[1][1])
     bt_axis.set_yticks(bt_yticks)
 
-    #Set up some gridlines to correspond to each y tick, except the top and bottom of the plot.
-    for xtick in bt_yticks[1:-1]:
-        plt.plot([0,100],[xtick,xtick],linestyle=':',color=(0.8,0.8,0.8),linewidth=0.5,alpha=0.35)
+    #Set up gridlines at the y ticks, drawn by the axis in one pass. The first and last
+    #tick sit on the plot frame, so their lines are hidden by the spines.
+    bt_axis.yaxis.grid(True,linestyle=':',color=(0.8,0.8,0.8),linewidth=0.5,alpha=0.35)
 
-    #Sets annotation for x axis.    
+    #Sets annotation for x axis.
     bt_axis.set_xlim(0,60)
     bt_axis.set_xticks(xtick_list)
-    bt_axis.set_xticklabels([label_dict[x] for x in region_unique],rotation=30,ha='right',family='sans-serif')
+    bt_axis.set_xticklabels(region_labels,rotation=30,ha='right',family='sans-serif')
 
-    #Sets up annotation for right y axis.
+    #Sets up annotation for right y axis, which carries the same ticks as the left one.
     bt_twin = bt_axis.twinx()
     bt_twin.set_ylim(ylimList[1][0],ylimList[1][1])
-    bt_yticks = []
-    bt_yticks.append(ylimList[1][0])
-    for l in range(10,ylimList[1][1],10):
-        if l != ylimList[1][0]:
-            bt_yticks.append(l)
-    if bt_yticks[-1] != ylimList[1][1]:
-        bt_yticks.append(ylimList[1][1])
     bt_twin.set_yticks(bt_yticks)
 
     #Set formatting for y axes
@@ -565,6 +671,8 @@ def plot_linear(regions,region_unique,label_dict,ifile_path,summary_output_file_
     fig.savefig(os.path.join(os.path.split(ifile_path)[0],'{:s}_PD_linear.png'.format(opic_string)),dpi=300)
     #Show plot
     plt.show()
+    #Persist the draws for the next run.
+    numpy.savez(bs_cache_path,input_hash=ifile_hash,**bs_cache)
     return bs_pack1,bs_pack2,region_means
 
 #This function makes six log-scaled plots that correspond to rates of urban expansion vs population change and
@@ -586,9 +694,14 @@ def plot_linear(regions,region_unique,label_dict,ifile_path,summary_output_file_
 ##  bs_pack2 - This has the bootstrapped estimates for population density for each size class, each decade, and each region.
 ##  region_means - This file has all the means and medians computed from bootstrapped estimates.
 def plot_log(regions,region_unique,label_dict,ifile_path,opic_string,number_of_decade_intervals,ylimList,bs_pack1,bs_pack2,region_means):
+    #Chart labels for the regions, looked up once rather than per axis.
+    region_labels = [label_dict[x] for x in region_unique]
     #Set up plot
     ##  Set up figure dimensions for Urban Area Expansion Rate and Population Change Rate
-    fig = plt.figure(1,figsize=(8,3))
+    ##Figure 1 is created on the first call and reused afterwards; clear the
+    ##previous call's artists.
+    fig = plt.figure(1) if plt.fignum_exists(1) else plt.figure(1,figsize=(8,3))
+    fig.clf()
     ##Set plot inside figure. This one is for population precentage.
     tp_axis = plt.axes([0.085,0.2,0.83,0.65])
     ##Clear X axis of default ticks.
@@ -606,7 +719,7 @@ def plot_log(regions,region_unique,label_dict,ifile_path,opic_string,number_of_d
         ##Set up colors for decades 70-80,80-90,90-00,00-10
         colors = [(0.0,0.0,0.6,1.0),(0.6,0.0,0.0,1.0),(0.0,0.6,0.0,1.0),(0.6,0.6,0.0,1.0)]
         ##Plot the custom symbol for each decade.
-        tp_axis.scatter(range(start,len(item)+start),item,s=50,marker=verts,color=colors,picker=True)
+        tp_axis.scatter(range(start,len(item)+start),item,s=50,marker=verts,color=colors)
         ##Set up positions to annotate for reach region.
         xtick_list.append(start+((len(item))/2.0)-0.5)
         start += number_of_decade_intervals + 1
@@ -617,16 +730,10 @@ def plot_log(regions,region_unique,label_dict,ifile_path,opic_string,number_of_d
     ##Set min,max of y axis
     tp_axis.set_ylim(ylimList[0][0],ylimList[0][1])
 
-    #Sets the y axis by a power of 2 between low value and high value on left y axis.
-    tp_yticks = []
-    tp_yticks.append(ylimList[0][0])
-    l = pow(2,0)
-    n = 0
-    while l <= ylimList[0][1]:
-        if l != ylimList[0][0]:
-            tp_yticks.append(l)
-        n+=1
-        l = pow(2,n)
+    #Sets the y axis by a power of 2 between low value and high value. The powers
+    #are generated in one numpy call. The list is computed once and shared with the
+    #right y axis below.
+    tp_yticks = [ylimList[0][0]]+[l for l in (2**numpy.arange(0,math.floor(math.log2(ylimList[0][1]))+1)).tolist() if l != ylimList[0][0]]
     if tp_yticks[-1] != ylimList[0][1]:
         tp_yticks.append(ylimList[0][1])
     tp_axis.set_yticks(tp_yticks)
@@ -634,9 +741,9 @@ def plot_log(regions,region_unique,label_dict,ifile_path,opic_string,number_of_d
     #Clear ticks on y axis to account for software issue of overlapping axes.
     tp_axis.yaxis.set_minor_formatter(nullfmt)
 
-    #Set up some gridlines to correspond to each y tick, except the top and bottom of the plot.
-    for xtick in tp_yticks[1:-1]:
-        plt.plot([0,100],[xtick,xtick],linestyle=':',color=(0.8,0.8,0.8),linewidth=0.5,alpha=0.35)
+    #Set up gridlines at the y ticks, drawn by the axis in one pass. The first and last
+    #tick sit on the plot frame, so their lines are hidden by the spines.
+    tp_axis.yaxis.grid(True,linestyle=':',color=(0.8,0.8,0.8),linewidth=0.5,alpha=0.35)
 
     #Create an axis on the right side of the plot. This axis will cover urban expansion percentage.
     mi_axis = tp_axis.twinx()
@@ -645,67 +752,71 @@ def plot_log(regions,region_unique,label_dict,ifile_path,opic_string,number_of_d
     xtick_list,xtick_label_list = [],[]
     start = 1
     k = 1
+    #Sets up colors for decades 70-80,80-90,90-00,00-10, plus unattached proxy
+    #artists that serve as the legend handles for them.
+    color_array = [(0.0,0.0,0.6,0.3),(0.6,0.0,0.0,0.3),(0.0,0.6,0.0,0.3),(0.6,0.6,0.0,0.3)]
+    scatter_list = [mlines.Line2D([],[],color=c,marker='o',linestyle='none',markeredgecolor='none',markersize=0.2**0.5) for c in color_array]
+    #Boxplot x offsets within a region's slot, computed once and shifted by
+    #start for each region.
+    box_offsets = numpy.arange(4)
+    #Boxplot count labels are collected during the loop and drawn in one pass
+    #after it. The 2-point upward offset is baked into a transform built once.
+    anno_list = []
+    anno_trans = mtrans.offset_copy(mi_axis.transData,fig=fig,x=0,y=2,units='points')
     #For each region...
     for m, cur_region in enumerate(region_unique):
         #Recieve values from linear plot
-        bs70,bs80,bs90,bs00 = bs_pack1[m]
-
-        #Create bootstrapped estimates of urban expansion estimates
-        data70,data80,data90,data00 = loc_average(regions,m,18,22)
+        bs70,bs80,bs90,bs00,orig_counts = bs_pack1[m]
 
-        #Create data_array to inputation into the plot. orig_array is used to calculate number of estimates.
+        #Create data_array to inputation into the plot. orig_counts carries the number
+        #of estimates over from the linear plot.
         data_array = [bs70,bs80,bs90,bs00]
-        orig_array = [data70,data80,data90,data00]
         #Sets up attributes for setting properties of boxplot.
-        color_array = [(0.0,0.0,0.6,0.3),(0.6,0.0,0.0,0.3),(0.0,0.6,0.0,0.3),(0.6,0.6,0.0,0.3)]
         index_array = [(0,1,1,1,0,1,0,1,0),(1,3,3,3,2,3,2,3,1),(2,5,5,5,4,5,4,5,2),(3,7,7,7,6,7,6,7,3)]
 
         #Sets up crude boxplot.
-        bp = mi_axis.boxplot(data_array,positions=list(numpy.linspace(start,4+start,4,False)),patch_artist=True,showfliers=False,zorder=10)
+        bp = mi_axis.boxplot(data_array,positions=box_offsets+start,patch_artist=True,showfliers=False,zorder=10)
 
 
         #Sets up jitter part of box-jitter plots and other cosmetic features.
-        scatter_list = []
+        jitter_x,jitter_y,jitter_c = [],[],[]
         #For each decade interval...
         for j in range(4):
-            plt.setp(bp['boxes'][index_array[j][0]], color=(0.6,0.6,0.6), lw=0.25, fill=False)
-            yanno = plt.getp(bp['caps'][index_array[j][1]],'ydata')[0]
-            xanno = (plt.getp(bp['caps'][index_array[j][2]],'xdata')[0]+plt.getp(bp['caps'][index_array[j][3]],'xdata')[1])/2.0
+            bp['boxes'][index_array[j][0]].set(color=(0.6,0.6,0.6), lw=0.25, fill=False)
+            yanno = bp['caps'][index_array[j][1]].get_ydata()[0]
+            xanno = (bp['caps'][index_array[j][2]].get_xdata()[0]+bp['caps'][index_array[j][3]].get_xdata()[1])/2.0
             #Ensures that width of jitter on bow jitter plot does not exceed width of boxplot element.
-            jitter_bias = abs(plt.getp(bp['caps'][index_array[j][2]],'xdata')[0]-xanno)
-            jitter = numpy.add(numpy.multiply(numpy.random.random_sample(len(data_array[j])),(2.0*jitter_bias)),(xanno-jitter_bias))
-            #This makes jitter plot and records handle for legend.
-            scatter_list.append(plt.scatter(jitter, data_array[j], c=[color_array[j]], marker='o', edgecolors='none', alpha=0.1, s=0.2, zorder=5))
-            #This sets up numbers on top of boxplots
-            plt.annotate('{:d}'.format(len(orig_array[j])),xy=(xanno,yanno),xytext=(0,2),size=5.25,horizontalalignment='center',textcoords='offset points')
+            jitter_bias = abs(bp['caps'][index_array[j][2]].get_xdata()[0]-xanno)
+            jitter = _RNG.uniform(xanno-jitter_bias,xanno+jitter_bias,size=len(data_array[j]))
+            #Collect this decade's jitter points; they are drawn in one batch per region below.
+            jitter_x.append(jitter)
+            jitter_y.append(data_array[j])
+            jitter_c.append(numpy.tile(color_array[j],(len(data_array[j]),1)))
+            #Record this boxplot's estimate count; the labels are drawn in one pass below.
+            anno_list.append((xanno,yanno,orig_counts[j]))
             #Makes edges of boxplots for less thickness and grey color.
-            plt.setp(bp['caps'][index_array[j][4]], color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['caps'][index_array[j][5]], color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['whiskers'][index_array[j][6]], color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['whiskers'][index_array[j][7]], color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['medians'][index_array[j][8]], color=(0.6,0.6,0.6), lw=0.25)
+            bp['caps'][index_array[j][4]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['caps'][index_array[j][5]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['whiskers'][index_array[j][6]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['whiskers'][index_array[j][7]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['medians'][index_array[j][8]].set(color=(0.6,0.6,0.6), lw=0.25)
+        #This makes the jitter plot with one scatter call per region instead of one per decade.
+        plt.scatter(numpy.concatenate(jitter_x),numpy.concatenate(jitter_y),c=numpy.concatenate(jitter_c),marker='o',edgecolors='none',alpha=0.1,s=0.2,zorder=5,rasterized=True)
         #Sets up ticks to annotate different regions.
         xtick_list.append(start+((4)/2.0)-0.5)
         start += number_of_decade_intervals + 1
 
+    #Draw the collected boxplot count labels in one pass over the flat list.
+    for xanno,yanno,n_est in anno_list:
+        mi_axis.text(xanno,yanno,'{:d}'.format(n_est),size=5.25,horizontalalignment='center',transform=anno_trans)
+
     #Set up axis as logarithmic
     mi_axis.set_yscale("log")
     #This sets the x and y limits.
     mi_axis.set_xlim(0,51)
     mi_axis.set_ylim(ylimList[0][0],ylimList[0][1])
 
-    #Sets the y axis with increments of 2 between low value and high value on right y axis.
-    tp_yticks = []
-    tp_yticks.append(ylimList[0][0])
-    l = pow(2,0)
-    n = 0
-    while l <= ylimList[0][1]:
-        if l != ylimList[0][0]:
-            tp_yticks.append(l)
-        n+=1
-        l = pow(2,n)
-    if tp_yticks[-1] != ylimList[0][1]:
-        tp_yticks.append(ylimList[0][1])
+    #The right y axis carries the same power-of-2 ticks as the left one.
     mi_axis.set_yticks(tp_yticks)
 
     #Clear ticks on right y axis to account for software issue of overlapping axes.
@@ -713,7 +824,7 @@ def plot_log(regions,region_unique,label_dict,ifile_path,opic_string,number_of_d
 
     #Sets annotation for x axis.
     tp_axis.set_xticks(xtick_list)
-    tp_axis.set_xticklabels([label_dict[x] for x in region_unique],horizontalalignment='right',rotation=30,family='sans-serif')
+    tp_axis.set_xticklabels(region_labels,horizontalalignment='right',rotation=30,family='sans-serif')
     tp_axis.yaxis.set_major_formatter(FormatStrFormatter('%.1f'))
 
     #Sets label for right y axes.
@@ -734,65 +845,86 @@ def plot_log(regions,region_unique,label_dict,ifile_path,opic_string,number_of_d
     plt.show()
 
     #Set up figure dimensions for Population Density
-    fig = plt.figure(2,figsize=(8,3))
+    ##Figure 2 is created on the first call and reused afterwards; clear the
+    ##previous call's artists.
+    fig = plt.figure(2) if plt.fignum_exists(2) else plt.figure(2,figsize=(8,3))
+    fig.clf()
     bt_axis = plt.axes([0.085,0.2,0.82,0.65])
 
     xtick_list = []
     xtick_label_list = []
     start = 1
     k = 1
-    
+
+    #Sets up colors for decades 1970-2010, plus unattached proxy artists that serve
+    #as the legend handles for them.
+    color_array = [(0.0,0.0,0.6,0.3),(0.6,0.0,0.0,0.3),(0.0,0.6,0.0,0.3),(0.6,0.6,0.0,0.3),(0.6,0.6,0.6,0.3)]
+    scatter_list = [mlines.Line2D([],[],color=c,marker='o',linestyle='none',markeredgecolor='none',markersize=0.2**0.5) for c in color_array]
+    #Boxplot x offsets within a region's slot, computed once and shifted by
+    #start for each region.
+    box_offsets = numpy.arange(5)
+    #Boxplot count labels are collected during the loop and drawn in one pass
+    #after it. The 2-point upward offset is baked into a transform built once.
+    anno_list = []
+    anno_trans = mtrans.offset_copy(bt_axis.transData,fig=fig,x=0,y=2,units='points')
     #For each region...
     for m, cur_region in enumerate(region_unique):
         #Recieved values from linear plot
-        bs70,bs80,bs90,bs00,bs10 = bs_pack2[m]
-        #Create estimates that are averaged from studies that cover the same location.
-        data70,data80,data90,data00,data10 = loc_average(regions,m,22,27)
+        bs70,bs80,bs90,bs00,bs10,orig_counts = bs_pack2[m]
 
-        #Create data_array to inputation into the plot. orig_array is used to calculate number of estimates.
+        #Create data_array to inputation into the plot. orig_counts carries the number
+        #of estimates over from the linear plot.
         data_array = [bs70,bs80,bs90,bs00,bs10]
-        orig_array = [data70,data80,data90,data00,data10]
         #Sets up attributes for setting properties of boxplot.
-        color_array = [(0.0,0.0,0.6,0.3),(0.6,0.0,0.0,0.3),(0.0,0.6,0.0,0.3),(0.6,0.6,0.0,0.3),(0.6,0.6,0.6,0.3)]
         index_array = [(0,1,1,1,0,1,0,1,0),(1,3,3,3,2,3,2,3,1),(2,5,5,5,4,5,4,5,2),(3,7,7,7,6,7,6,7,3),(4,9,9,9,8,9,8,9,4)]
 
         #Sets up crude boxplot.
-        bp = plt.boxplot(data_array,positions=list(numpy.linspace(start,5+start,5,False)),patch_artist=True,showfliers=False,zorder=10)
+        bp = plt.boxplot(data_array,positions=box_offsets+start,patch_artist=True,showfliers=False,zorder=10)
 
         #Sets up jitter part of box-jitter plots and other cosmetic features.
-        scatter_list = []
+        jitter_x,jitter_y,jitter_c = [],[],[]
         #For each decade...        
         for j in range(5):
-            plt.setp(bp['boxes'][index_array[j][0]],    color=(0.6,0.6,0.6), lw=0.25, fill=False)
-            yanno = plt.getp(bp['caps'][index_array[j][1]],'ydata')[0]
-            xanno = (plt.getp(bp['caps'][index_array[j][2]],'xdata')[0]+plt.getp(bp['caps'][index_array[j][3]],'xdata')[1])/2.0
+            bp['boxes'][index_array[j][0]].set(color=(0.6,0.6,0.6), lw=0.25, fill=False)
+            yanno = bp['caps'][index_array[j][1]].get_ydata()[0]
+            xanno = (bp['caps'][index_array[j][2]].get_xdata()[0]+bp['caps'][index_array[j][3]].get_xdata()[1])/2.0
             #Ensures that width of jitter on bow jitter plot does not exceed width of boxplot element.
-            jitter_bias = abs(plt.getp(bp['caps'][index_array[j][2]],'xdata')[0]-xanno)
-            jitter = numpy.add(numpy.multiply(numpy.random.random_sample(len(data_array[j])),(2.0*jitter_bias)),(xanno-jitter_bias))
-            #This makes jitter plot and records handle for legend.
-            scatter_list.append(plt.scatter(jitter, data_array[j], c=[color_array[j]], marker='o', edgecolors='none', alpha=0.1, s=0.2, zorder=5))
-            #This sets up numbers on top of boxplots
-            plt.annotate('{:d}'.format(len(orig_array[j])),xy=(xanno,yanno),xytext=(0,2),size=5.25,horizontalalignment='center',textcoords='offset points')
+            jitter_bias = abs(bp['caps'][index_array[j][2]].get_xdata()[0]-xanno)
+            jitter = _RNG.uniform(xanno-jitter_bias,xanno+jitter_bias,size=len(data_array[j]))
+            #Collect this decade's jitter points; they are drawn in one batch per region below.
+            jitter_x.append(jitter)
+            jitter_y.append(data_array[j])
+            jitter_c.append(numpy.tile(color_array[j],(len(data_array[j]),1)))
+            #Record this boxplot's estimate count; the labels are drawn in one pass below.
+            anno_list.append((xanno,yanno,orig_counts[j]))
             #Makes edges of boxplots for less thickness and grey color.
-            plt.setp(bp['caps'][index_array[j][4]],     color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['caps'][index_array[j][5]],     color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['whiskers'][index_array[j][6]], color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['whiskers'][index_array[j][7]], color=(0.6,0.6,0.6), lw=0.25)
-            plt.setp(bp['medians'][index_array[j][8]],  color=(0.6,0.6,0.6), lw=0.25)
-
-        #Sets up legend for plot
-        leg = bt_axis.legend(tuple(scatter_list),("1970","1980","1990","2000","2010"),scatterpoints=1,markerscale=10.0,edgecolor=(0,0,0),fontsize=6.0,loc="upper left",bbox_to_anchor=(0.02,0.98))
-        for lh in leg.legendHandles:
-            lh.set_alpha(1)
-        leg.set_zorder(20)
-        leg.set_alpha(1)
+            bp['caps'][index_array[j][4]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['caps'][index_array[j][5]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['whiskers'][index_array[j][6]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['whiskers'][index_array[j][7]].set(color=(0.6,0.6,0.6), lw=0.25)
+            bp['medians'][index_array[j][8]].set(color=(0.6,0.6,0.6), lw=0.25)
+
+        #This makes the jitter plot with one scatter call per region instead of one per decade.
+        plt.scatter(numpy.concatenate(jitter_x),numpy.concatenate(jitter_y),c=numpy.concatenate(jitter_c),marker='o',edgecolors='none',alpha=0.1,s=0.2,zorder=5,rasterized=True)
         xtick_list.append(start+((5)/2.0)-0.5)
         start += number_of_decade_intervals + 2
 
+    #Sets up legend for plot once per figure, rather than once per region.
+    leg = bt_axis.legend(tuple(scatter_list),("1970","1980","1990","2000","2010"),scatterpoints=1,markerscale=10.0,edgecolor=(0,0,0),fontsize=6.0,loc="upper left",bbox_to_anchor=(0.02,0.98))
+    for lh in leg.legendHandles:
+        lh.set_alpha(1)
+    leg.set_zorder(20)
+    leg.set_alpha(1)
+
+    #Draw the collected boxplot count labels in one pass over the flat list.
+    for xanno,yanno,n_est in anno_list:
+        bt_axis.text(xanno,yanno,'{:d}'.format(n_est),size=5.25,horizontalalignment='center',transform=anno_trans)
+
     #Sets y axis as logarithmic
     bt_axis.set_yscale("log")
 
-    #Sets annotation for y axis.
+    #Sets annotation for y axis. The tick list is computed once and shared with the
+    #right y axis below.
     bt_axis.set_ylim(ylimList[1][0],ylimList[1][1])
     bt_yticks = []
     bt_yticks.append(ylimList[1][0])
@@ -803,14 +935,14 @@ def plot_log(regions,region_unique,label_dict,ifile_path,opic_string,number_of_d
         bt_yticks.append(ylimList[1][1])
     bt_axis.set_yticks(bt_yticks)
 
-    #Set grid for tick locations
-    for xtick in bt_yticks[1:-1]:
-        plt.plot([0,100],[xtick,xtick],linestyle=':',color=(0.8,0.8,0.8),linewidth=0.5,alpha=0.35)
+    #Set grid for tick locations, drawn by the axis in one pass. The first and last
+    #tick sit on the plot frame, so their lines are hidden by the spines.
+    bt_axis.yaxis.grid(True,linestyle=':',color=(0.8,0.8,0.8),linewidth=0.5,alpha=0.35)
 
     #Set annoatation for x axis
     bt_axis.set_xlim(0,60)
     bt_axis.set_xticks(xtick_list)
-    bt_axis.set_xticklabels([label_dict[x] for x in region_unique],rotation=30,ha='right',family='sans-serif')
+    bt_axis.set_xticklabels(region_labels,rotation=30,ha='right',family='sans-serif')
 
     #Clear ticks on right y axis to account for software issue of overlapping axes.
     bt_axis.yaxis.set_minor_formatter(nullfmt)
@@ -819,13 +951,7 @@ def plot_log(regions,region_unique,label_dict,ifile_path,opic_string,number_of_d
     bt_twin = bt_axis.twinx()
     bt_twin.set_yscale("log")
     bt_twin.set_ylim(ylimList[1][0],ylimList[1][1])
-    bt_yticks = []
-    bt_yticks.append(ylimList[1][0])
-    for l in range(10,ylimList[1][1],10):
-        if l != ylimList[1][0]:
-            bt_yticks.append(l)
-    if bt_yticks[-1] != ylimList[1][1]:
-        bt_yticks.append(ylimList[1][1])
+    #The right y axis carries the same ticks as the left one.
     bt_twin.set_yticks(bt_yticks)
 
     #Clear ticks on y axis to account for software issue of overlapping axes.
@@ -845,83 +971,85 @@ def plot_log(regions,region_unique,label_dict,ifile_path,opic_string,number_of_d
     plt.show()
 
 
-#This is where user specifies input file.
-input_file = sys.argv[1]
-input_file_handle = open(input_file,'r',encoding="latin-1")
-input_file_path = os.path.split(input_file)[0]
-
-#This specifies summary file
-summary_output_file = "{:s}".format(os.path.join(input_file_path,''.join(['regional_location_summary',os.path.splitext(input_file)[1]])))
-summary_output_file_handle = open(summary_output_file,'w')
-
-#This specifies Bootstrap Output file
-bstrap_output_file_handle = pandas.ExcelWriter("{:s}".format(os.path.join(input_file_path,''.join(['regional_location_bstrap',".xlsx"]))))
-
-#Read in Data
-file_data = input_file_handle.read()
-input_file_handle.close()
-
-#Split data into lines, and get rid of blank lines.
-file_lines = file_data.split("\n")
-while file_lines.count('') > 0:
-    file_lines.remove('')
-while file_lines.count(' ') > 0:
-    file_lines.remove(' ')
-
-#Get rid of header line, so that all that remains are data.
-title_line = file_lines.pop(0)
-
-#Split all lines by commas.
-data_items = [x.split(",") for x in file_lines]
-#Sets presribed order of regions to display on plot.
-region_unique = ["N Am","CS Am","Europe","Africa","SW Asia","SC Asia","India","China","E Asia","SE Asia"]
-
-#Sets lables for regions.
-label_dict = {
-    "N Am":"North America",
-    "CS Am":"Latin America",
-    "Europe":"Europe",
-    "Africa":"Africa",
-    "SW Asia":"Southwest Asia",
-    "SC Asia":"Central-South Asia",
-    "India":"India",
-    "China":"China",
-    "E Asia":"East Asia",
-    "SE Asia":"Southeast Asia"
-}
-
-#Set up regions data structure (list of lists of lists).
-regions = []
-for region in region_unique:
-    regions.append([data_line for data_line in data_items if data_line[2] == region])
-
-#Establish each size class, all, above 2 million, and below 2 million.
-allregions = copy.deepcopy(regions)
-aboveregions = [[x for x in region_line if float(x[8]) > 2000.0] for region_line in allregions]
-belowregions = [[x for x in region_line if float(x[8]) <= 2000.0] for region_line in allregions]
-
-##Set y limits
-ylimList = [(0,12),(1,60)]
-##Create linear plot of changes in population vs urban expansion and population density for all cities.
-bs_pack1,bs_pack2,region_means = plot_linear(allregions,region_unique,label_dict,input_file,summary_output_file_handle,bstrap_output_file_handle,'regional_all_location',4,ylimList)
-ylimList = [(0.1,12),(1,60)]
-##Create log plot of changes in population and urban expansion.
-plot_log(allregions,region_unique,label_dict,input_file,'regional_all_location',4,ylimList,bs_pack1,bs_pack2,region_means)
-ylimList = [(0,12),(1,60)]
-##Create linear plot of changes in population vs urban expansion and population density for all cities above 2 million.
-bs_pack1,bs_pack2,region_means = plot_linear(aboveregions,region_unique,label_dict,input_file,summary_output_file_handle,bstrap_output_file_handle,'regional_above_location',4,ylimList)
-ylimList = [(0.1,12),(1,60)]
-##Create log plot of changes in population and urban expansion for all cities above 2 million.
-plot_log(aboveregions,region_unique,label_dict,input_file,'regional_above_location',4,ylimList,bs_pack1,bs_pack2,region_means)
-ylimList = [(0,12),(1,60)]
-##Create linear plot of changes in population vs urban expansion and population density for all cities below 2 million.
-bs_pack1,bs_pack2,region_means = plot_linear(belowregions,region_unique,label_dict,input_file,summary_output_file_handle,bstrap_output_file_handle,'regional_below_location',4,ylimList)
-ylimList = [(0.1,12),(1,60)]
-##Create log plot of changes in population and urban expansion for all cities below 2 million.
-plot_log(belowregions,region_unique,label_dict,input_file,'regional_below_location',4,ylimList,bs_pack1,bs_pack2,region_means)
-
-#Close summary output file handle
-summary_output_file_handle.close()
-bstrap_output_file_handle.save()
-#Restore codepage. This is depdendent on the MS-DOS version of chcp.
-subprocess.Popen(['chcp',str(msg)],shell=True,stdout=subprocess.PIPE)
+#The driver below only runs when the file is executed as a script, so the plot
+#functions can be imported without side effects.
+if __name__ == "__main__":
+    #This is where user specifies input file.
+    input_file = sys.argv[1]
+    input_file_path = os.path.split(input_file)[0]
+
+    #This specifies summary file
+    summary_output_file = "{:s}".format(os.path.join(input_file_path,''.join(['regional_location_summary',os.path.splitext(input_file)[1]])))
+    summary_output_file_handle = open(summary_output_file,'w')
+
+    #This specifies Bootstrap Output file
+    bstrap_output_file_handle = pandas.ExcelWriter("{:s}".format(os.path.join(input_file_path,''.join(['regional_location_bstrap',".xlsx"]))))
+
+    #Read in Data with pandas' CSV parser (the PyArrow engine when it is installed, the C
+    #engine otherwise). Cells stay strings and blank cells stay '' so the downstream
+    #handling of blank measurements is unchanged. The parser consumes the header line,
+    #skips blank lines, and handles the quoted Authors column, which the old per-line
+    #split(",") sliced apart (harmlessly, since it sits past the measurement columns).
+    try:
+        data_in = pandas.read_csv(input_file,encoding="latin-1",dtype=str,keep_default_na=False,engine="pyarrow")
+    except (ImportError,ValueError):
+        data_in = pandas.read_csv(input_file,encoding="latin-1",dtype=str,keep_default_na=False)
+    data_items = data_in.values.tolist()
+    #Sets presribed order of regions to display on plot.
+    region_unique = ["N Am","CS Am","Europe","Africa","SW Asia","SC Asia","India","China","E Asia","SE Asia"]
+
+    #Sets lables for regions.
+    label_dict = {
+        "N Am":"North America",
+        "CS Am":"Latin America",
+        "Europe":"Europe",
+        "Africa":"Africa",
+        "SW Asia":"Southwest Asia",
+        "SC Asia":"Central-South Asia",
+        "India":"India",
+        "China":"China",
+        "E Asia":"East Asia",
+        "SE Asia":"Southeast Asia"
+    }
+
+    #Set up regions data structure (list of lists of lists). Bucket the rows by their
+    #region keyword in one pass over the data instead of rescanning it per region, then
+    #order the buckets as they are displayed.
+    region_rows = {region:[] for region in region_unique}
+    for data_line in data_items:
+        if data_line[2] in region_rows:
+            region_rows[data_line[2]].append(data_line)
+    regions = [region_rows[region] for region in region_unique]
+
+    #Establish each size class, all, above 2 million, and below 2 million. Nothing ever
+    #mutates the rows, so the size classes can share them; the filters build new outer
+    #lists rather than deep copies of every row.
+    allregions = regions
+    aboveregions = [[x for x in region_line if float(x[8]) > 2000.0] for region_line in regions]
+    belowregions = [[x for x in region_line if float(x[8]) <= 2000.0] for region_line in regions]
+
+    ##Set y limits
+    ylimList = [(0,12),(1,60)]
+    ##Create linear plot of changes in population vs urban expansion and population density for all cities.
+    bs_pack1,bs_pack2,region_means = plot_linear(allregions,region_unique,label_dict,input_file,summary_output_file_handle,bstrap_output_file_handle,'regional_all_location',4,ylimList)
+    ylimList = [(0.1,12),(1,60)]
+    ##Create log plot of changes in population and urban expansion.
+    plot_log(allregions,region_unique,label_dict,input_file,'regional_all_location',4,ylimList,bs_pack1,bs_pack2,region_means)
+    ylimList = [(0,12),(1,60)]
+    ##Create linear plot of changes in population vs urban expansion and population density for all cities above 2 million.
+    bs_pack1,bs_pack2,region_means = plot_linear(aboveregions,region_unique,label_dict,input_file,summary_output_file_handle,bstrap_output_file_handle,'regional_above_location',4,ylimList)
+    ylimList = [(0.1,12),(1,60)]
+    ##Create log plot of changes in population and urban expansion for all cities above 2 million.
+    plot_log(aboveregions,region_unique,label_dict,input_file,'regional_above_location',4,ylimList,bs_pack1,bs_pack2,region_means)
+    ylimList = [(0,12),(1,60)]
+    ##Create linear plot of changes in population vs urban expansion and population density for all cities below 2 million.
+    bs_pack1,bs_pack2,region_means = plot_linear(belowregions,region_unique,label_dict,input_file,summary_output_file_handle,bstrap_output_file_handle,'regional_below_location',4,ylimList)
+    ylimList = [(0.1,12),(1,60)]
+    ##Create log plot of changes in population and urban expansion for all cities below 2 million.
+    plot_log(belowregions,region_unique,label_dict,input_file,'regional_below_location',4,ylimList,bs_pack1,bs_pack2,region_means)
+
+    #Close summary output file handle
+    summary_output_file_handle.close()
+    bstrap_output_file_handle.save()
+    #Restore codepage. This is depdendent on the MS-DOS version of chcp.
+    subprocess.Popen(['chcp',str(msg)],shell=True,stdout=subprocess.PIPE)